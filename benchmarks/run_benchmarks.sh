@@ -85,7 +85,7 @@ run_benchmark() {
     fi
     
     # Display summary
-    grep -E "Requests/sec:|Latency" "$RESULTS_DIR/${name}.txt" || true
+    grep -F -e "Requests/sec:" -e "Latency" "$RESULTS_DIR/${name}.txt" || true
 }
 
 # Run benchmarks
@@ -100,7 +100,7 @@ echo -e "\n${BLUE}High concurrency test (500 connections)...${NC}"
 wrk -t$THREADS -c500 -d${DURATION}s \
     --latency \
     "http://localhost:$PORT/" > "$RESULTS_DIR/high_concurrency.txt" 2>&1
-grep -E "Requests/sec:|Latency" "$RESULTS_DIR/high_concurrency.txt" || true
+grep -F -e "Requests/sec:" -e "Latency" "$RESULTS_DIR/high_concurrency.txt" || true
 
 # Cleanup
 echo -e "\n${BLUE}Cleaning up...${NC}"
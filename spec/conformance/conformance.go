@@ -9,21 +9,35 @@ import (
 	"flag"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"os"
 	"os/exec"
 	"strings"
+	"sync"
 	"syscall"
 	"time"
 )
 
 const (
-	defaultPort = 8080
-	timeout     = 10 * time.Second
+	defaultPort    = 8080
+	timeout        = 10 * time.Second
+	startupTimeout = 30 * time.Second
 )
 
 var (
 	port int
+	
+	// client is shared by every check so requests reuse keep-alive
+	// connections to the server instead of dialing a new one each time.
+	client = &http.Client{
+		Timeout: timeout,
+		Transport: &http.Transport{
+			MaxIdleConns:        16,
+			MaxIdleConnsPerHost: 16,
+			IdleConnTimeout:     30 * time.Second,
+		},
+	}
 )
 
 type testResult struct {
@@ -68,15 +82,26 @@ func startServer(port int) *exec.Cmd {
 		os.Exit(1)
 	}
 	
-	// Wait for server to be ready
-	for i := 0; i < 30; i++ {
-		resp, err := http.Get(fmt.Sprintf("http://localhost:%d/health", port))
-		if err == nil && resp.StatusCode == 200 {
-			resp.Body.Close()
-			fmt.Println("[PASS] Server started successfully")
-			return cmd
+	// Wait for server to be ready. A cheap TCP connect tells us when the
+	// listener is up; only then is /health asked to confirm. The poll
+	// interval backs off so a fast start is noticed within milliseconds.
+	addr := fmt.Sprintf("localhost:%d", port)
+	deadline := time.Now().Add(startupTimeout)
+	delay := 10 * time.Millisecond
+	for time.Now().Before(deadline) {
+		if conn, err := net.DialTimeout("tcp", addr, 200*time.Millisecond); err == nil {
+			conn.Close()
+			resp, err := client.Get(fmt.Sprintf("http://%s/health", addr))
+			if err == nil {
+				drainAndClose(resp)
+				if resp.StatusCode == 200 {
+					fmt.Println("[PASS] Server started successfully")
+					return cmd
+				}
+			}
 		}
-		time.Sleep(time.Second)
+		time.Sleep(delay)
+		delay = min(delay*3/2, 500*time.Millisecond)
 	}
 	
 	fmt.Println("[FAIL] Server failed to start")
@@ -95,8 +120,22 @@ func stopServer(cmd *exec.Cmd) {
 func testBasicHTTP(port int, result *testResult) {
 	fmt.Println("[INFO] Testing basic HTTP endpoints...")
 	
+	// The basic checks are independent of each other, so issue them
+	// concurrently and report the results in a fixed order.
+	paths := []string{"/health", "/", "/nonexistent"}
+	statuses := make([]int, len(paths))
+	var wg sync.WaitGroup
+	for i, path := range paths {
+		wg.Add(1)
+		go func(i int, path string) {
+			defer wg.Done()
+			statuses[i] = testEndpointStatus(port, path, "GET", nil)
+		}(i, path)
+	}
+	wg.Wait()
+	
 	// Test health
-	if testEndpoint(port, "/health", "GET", nil, 200) {
+	if statuses[0] == 200 {
 		fmt.Println("[PASS] Health check")
 		result.passed++
 	} else {
@@ -105,7 +144,7 @@ func testBasicHTTP(port int, result *testResult) {
 	}
 	
 	// Test root
-	if testEndpoint(port, "/", "GET", nil, 200) {
+	if statuses[1] == 200 {
 		fmt.Println("[PASS] Root path")
 		result.passed++
 	} else {
@@ -114,7 +153,7 @@ func testBasicHTTP(port int, result *testResult) {
 	}
 	
 	// Test 404 - some servers may have a catch-all handler
-	resp404 := testEndpointStatus(port, "/nonexistent", "GET", nil)
+	resp404 := statuses[2]
 	if resp404 == 404 {
 		fmt.Println("[PASS] 404 Not Found (proper 404)")
 		result.passed++
@@ -213,12 +252,11 @@ func testEndpointStatus(port int, path string, method string, body interface{})
 		return 0
 	}
 	
-	client := &http.Client{Timeout: timeout}
 	resp, err := client.Do(req)
 	if err != nil {
 		return 0
 	}
-	defer resp.Body.Close()
+	drainAndClose(resp)
 	
 	return resp.StatusCode
 }
@@ -241,7 +279,6 @@ func fetchResponse(port int, path string, method string, body interface{}) map[s
 		return nil
 	}
 	
-	client := &http.Client{Timeout: timeout}
 	resp, err := client.Do(req)
 	if err != nil {
 		return nil
@@ -263,7 +300,7 @@ func fetchResponse(port int, path string, method string, body interface{}) map[s
 }
 
 func checkMCPAvailable(port int) bool {
-	resp, err := http.Post(
+	resp, err := client.Post(
 		fmt.Sprintf("http://localhost:%d/mcp", port),
 		"application/json",
 		strings.NewReader(`{}`),
@@ -271,10 +308,17 @@ func checkMCPAvailable(port int) bool {
 	if err != nil {
 		return false
 	}
-	resp.Body.Close()
+	drainAndClose(resp)
 	return resp.StatusCode != 404
 }
 
+// drainAndClose reads any unread body before closing it so the underlying
+// connection can be returned to the client's idle pool.
+func drainAndClose(resp *http.Response) {
+	io.Copy(io.Discard, resp.Body)
+	resp.Body.Close()
+}
+
 func printSummary(result *testResult) {
 	fmt.Println("\n" + strings.Repeat("=", 50))
 	fmt.Println("[INFO] Conformance Test Summary")